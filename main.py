@@ -1,10 +1,13 @@
 import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from src.config import Config
-from src.nba_api import NBAClient
-from src.rankings import RankingsChecker
-from src.formatter import GameFormatter
-from src.slack_client import SlackClient
+
+def write_progress(progress):
+    """Write buffered (index, line) progress entries in game order."""
+    if progress:
+        sys.stdout.write("\n".join(line for _, line in sorted(progress)) + "\n")
+        sys.stdout.flush()
 
 
 def main():
@@ -17,13 +20,25 @@ def main():
     )
     args = parser.parse_args()
 
+    # Deferred so --help doesn't pay for dotenv/requests/Slack imports
+    from src.config import Config
+    from src.nba_api import NBAClient, create_session
+    from src.rankings import RankingsChecker
+    from src.formatter import GameFormatter
+    from src.slack_client import SlackClient
+
+    # Shared HTTP session so NBA API calls reuse pooled connections
+    session = create_session()
+    slack = None
+    progress = []
+
     try:
         # Validate configuration
         Config.validate()
 
         # Initialize clients
-        nba = NBAClient()
-        rankings_checker = RankingsChecker()
+        nba = NBAClient(session=session)
+        rankings_checker = RankingsChecker(session=session)
 
         # Select channel based on flag (default: daily threads)
         if args.ed_testing:
@@ -37,13 +52,16 @@ def main():
 
         formatter = GameFormatter(nba_client=nba, rankings_checker=rankings_checker)
 
-        # Load rankings data once
-        print("Loading team and player rankings...")
-        formatter.load_rankings(season_year="2025-26")
-
-        # Fetch games
+        # Fetch games in the background while rankings load (independent requests)
         print("Fetching today's NBA games...")
-        data = nba.get_todays_games()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            games_future = executor.submit(nba.get_todays_games)
+
+            # Load rankings data once
+            print("Loading team and player rankings...")
+            formatter.load_rankings(season_year="2025-26")
+
+            data = games_future.result()
 
         # Format games with parent/thread structure
         print("Formatting games...")
@@ -54,24 +72,29 @@ def main():
             slack.send_message("No NBA games scheduled for today")
             return
 
-        # Send each game as parent message with threaded replies
-        print(f"Sending {len(formatted_games)} games to Slack ({channel_name})...")
-        for i, game_data in enumerate(formatted_games, 1):
-            parent_text = game_data["parent"]
-            thread_text = game_data["thread"]
-            injury_thread = game_data.get("injury_thread")
-
-            result = slack.send_game_with_thread(parent_text, thread_text, injury_thread)
+        # Send parent messages in order, then threaded replies concurrently
+        total = len(formatted_games)
+        print(f"Sending {total} games to Slack ({channel_name})...")
+        for i, result in slack.send_games_with_threads(formatted_games):
+            thread_status = "with thread" if result["thread"] else "no thread"
+            injury_status = "+ injuries" if result["injury_thread"] else ""
+            line = f"Game {i + 1}/{total}: sent ({thread_status}{injury_status})"
+            progress.append((i, line))
 
-            thread_status = "with thread" if thread_text else "no thread"
-            injury_status = "+ injuries" if injury_thread else ""
-            print(f"Game {i}/{len(formatted_games)}: sent ({thread_status}{injury_status})")
+        # Write per-game progress in one batch (in game order) rather than per game
+        write_progress(progress)
 
-        print(f"✓ All {len(formatted_games)} games sent successfully!")
+        print(f"✓ All {total} games sent successfully!")
 
     except Exception as e:
+        # Report games already sent in full so a re-run can avoid double-posting
+        write_progress(progress)
         print(f"✗ Error: {e}")
         raise
+    finally:
+        session.close()
+        if slack is not None:
+            slack.close()
 
 
 if __name__ == "__main__":
@@ -1,46 +1,65 @@
 import os
+from dataclasses import MISSING, dataclass, fields
+from typing import Optional
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-class Config:
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Immutable snapshot of environment configuration, read once at import."""
+
     # NBA API Keys
-    NBA_API_KEY = os.getenv("NBA_API_KEY")
-    NBA_ALERTS_API_KEY = os.getenv("NBA_ALERTS_API_KEY")
-    NBA_STANDINGS_KEY = os.getenv("NBA_STANDINGS_KEY")
-    QUERY_TOOL_API_KEY = os.getenv("QUERY_TOOL_API_KEY")
-    STATS_API_KEY = os.getenv("STATS_API_KEY")
-    NBA_API_BASE = "https://api.nba.com/v0"
-    LEAGUE_ID = "00"  # NBA
+    NBA_API_KEY: Optional[str]
+    NBA_ALERTS_API_KEY: Optional[str]
+    NBA_STANDINGS_KEY: Optional[str]
+    QUERY_TOOL_API_KEY: Optional[str]
+    STATS_API_KEY: Optional[str]
 
     # Slack OAuth Configuration
-    SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+    SLACK_BOT_TOKEN: Optional[str]
 
     # Slack Channel IDs
-    SLACK_CHANNEL_ID_ED_TESTING = os.getenv("SLACK_CHANNEL_ID_ED_TESTING")
-    SLACK_CHANNEL_ID_DAILY_THREADS = os.getenv("SLACK_CHANNEL_ID_DAILY_THREADS")
-    SLACK_CHANNEL_ID_MOOKIE = os.getenv("SLACK_CHANNEL_ID_MOOKIE")
+    SLACK_CHANNEL_ID_ED_TESTING: Optional[str]
+    SLACK_CHANNEL_ID_DAILY_THREADS: Optional[str]
+    SLACK_CHANNEL_ID_MOOKIE: Optional[str]
 
     # Legacy webhook URLs (kept for backwards compatibility)
-    SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
-    ED_TEST_WEBHOOK_URL = os.getenv("ED_TEST_WEBHOOK_URL")
-    SLACKHOOK2_URL = os.getenv("SLACKHOOK2_URL")
+    SLACK_WEBHOOK_URL: Optional[str]
+    ED_TEST_WEBHOOK_URL: Optional[str]
+    SLACKHOOK2_URL: Optional[str]
+
+    # On-disk cache for daily data (defaults to ~/.cache/threads, no TTL)
+    THREADS_CACHE_DIR: Optional[str]
+    THREADS_CACHE_TTL_MIN: Optional[str]
 
-    @classmethod
-    def validate(cls, require_nba_key=True):
+    NBA_API_BASE: str = "https://api.nba.com/v0"
+    LEAGUE_ID: str = "00"  # NBA
+
+    def validate(self, require_nba_key=True):
         """Validate that required config is present"""
-        if require_nba_key and not cls.NBA_API_KEY:
-            raise ValueError("NBA_API_KEY not found in environment")
-        if not cls.NBA_ALERTS_API_KEY:
-            raise ValueError("NBA_ALERTS_API_KEY not found in environment")
-        if not cls.QUERY_TOOL_API_KEY:
-            raise ValueError("QUERY_TOOL_API_KEY not found in environment")
-        if not cls.STATS_API_KEY:
-            raise ValueError("STATS_API_KEY not found in environment")
-
-        # Validate Slack OAuth configuration
-        if not cls.SLACK_BOT_TOKEN:
-            raise ValueError("SLACK_BOT_TOKEN not found in environment")
-        if not cls.SLACK_CHANNEL_ID_DAILY_THREADS:
-            raise ValueError("SLACK_CHANNEL_ID_DAILY_THREADS not found in environment")
+        required = _REQUIRED if require_nba_key else _REQUIRED[1:]
+        missing = [key for key in required if not getattr(self, key)]
+        if missing:
+            raise ValueError(f"{missing[0]} not found in environment")
+
+
+# Checked in order so the first missing key is reported (NBA_API_KEY first)
+_REQUIRED = (
+    "NBA_API_KEY",
+    "NBA_ALERTS_API_KEY",
+    "QUERY_TOOL_API_KEY",
+    "STATS_API_KEY",
+    "SLACK_BOT_TOKEN",
+    "SLACK_CHANNEL_ID_DAILY_THREADS",
+)
+
+# Environment-backed fields (those without a hardcoded default)
+_ENV_FIELDS = tuple(f.name for f in fields(_Config) if f.default is MISSING)
+
+CONFIG = _Config(**{key: os.getenv(key) for key in _ENV_FIELDS})
+
+# Backwards-compatible name used throughout the codebase
+Config = CONFIG
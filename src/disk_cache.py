@@ -0,0 +1,127 @@
+"""
+On-disk cache for daily NBA data (standings, rankings) shared across runs.
+
+Entries are stored as JSON rather than pickled, so a cache file can only ever
+hold data, never code.
+"""
+
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+from .config import Config
+
+
+def _cache_dir() -> Path:
+    """Directory holding cache files (THREADS_CACHE_DIR or ~/.cache/threads)."""
+    if Config.THREADS_CACHE_DIR:
+        return Path(Config.THREADS_CACHE_DIR)
+    return Path.home() / ".cache" / "threads"
+
+
+def _cache_path(name: str) -> Path:
+    """Path of today's cache file for the given name."""
+    return _cache_dir() / f"{name}-{date.today().isoformat()}.json"
+
+
+def _entry_paths(name: str):
+    """Yield (path, day) for the name's cache files from any day."""
+    prefix_len = len(name) + 1
+    for path in _cache_dir().glob(f"{name}-*.json"):
+        day = path.stem[prefix_len:]
+        try:
+            date.fromisoformat(day)
+        except ValueError:
+            # A longer entry name sharing this prefix (e.g., "rankings-2025-26")
+            continue
+        yield path, day
+
+
+def _remove(path: Path):
+    """Delete a cache file, ignoring files that are already gone."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Warning: Could not remove cache {path}: {e}")
+
+
+def cache_load(name: str, ttl_minutes: Optional[float] = None) -> Optional[Any]:
+    """
+    Load today's cached object for a name.
+
+    Args:
+        name: Cache entry name (e.g., "standings")
+        ttl_minutes: Max entry age; defaults to THREADS_CACHE_TTL_MIN (no limit)
+
+    Returns:
+        The cached object, or None if missing, expired, or unreadable
+    """
+    path = _cache_path(name)
+    try:
+        if ttl_minutes is None and Config.THREADS_CACHE_TTL_MIN:
+            ttl_minutes = float(Config.THREADS_CACHE_TTL_MIN)
+        if ttl_minutes is not None:
+            age_minutes = (time.time() - path.stat().st_mtime) / 60
+            if age_minutes > ttl_minutes:
+                return None
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read cache {path}: {e}")
+        return None
+
+
+def cache_store(name: str, obj: Any):
+    """
+    Store an object as today's cache entry for a name.
+
+    Args:
+        name: Cache entry name (e.g., "standings")
+        obj: JSON-serializable object to store (str dict keys; tuples load as lists)
+    """
+    path = _cache_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial file
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(obj))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        print(f"Warning: Could not write cache {path}: {e}")
+        return
+
+    # Entries are per day, so earlier days' files for this name are never read
+    today = date.today().isoformat()
+    try:
+        stale = [p for p, day in _entry_paths(name) if day != today]
+    except OSError as e:
+        print(f"Warning: Could not prune cache {name}: {e}")
+        return
+    for old_path in stale:
+        _remove(old_path)
+
+
+def cache_delete(name: str):
+    """
+    Delete cached entries for a name from every day, forcing a refetch.
+
+    Entries named with this prefix (e.g., "rankings" covers "rankings-2025-26")
+    are deleted too.
+
+    Args:
+        name: Cache entry name or name prefix (e.g., "standings")
+    """
+    try:
+        paths = list(_cache_dir().glob(f"{name}-*.json"))
+    except OSError as e:
+        print(f"Warning: Could not clear cache {name}: {e}")
+        return
+    for path in paths:
+        _remove(path)
@@ -1,6 +1,50 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from .mapping import get_broadcaster_emoji
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from .mapping import get_broadcaster_emoji, get_team_emoji
 from .injuries import InjuriesClient
+from .disk_cache import cache_delete, cache_load, cache_store
+
+# Schedule team fields read for every game, with defaults for missing keys
+_TEAM_DEFAULTS = {"teamTricode": "", "wins": 0, "losses": 0, "teamId": None}
+_TEAM_FIELDS = itemgetter("teamTricode", "wins", "losses", "teamId")
+
+
+def _team_fields(team: dict) -> tuple:
+    """Return (tricode, wins, losses, team_id), filling defaults for missing keys"""
+    try:
+        return _TEAM_FIELDS(team)
+    except KeyError:
+        return _TEAM_FIELDS({**_TEAM_DEFAULTS, **team})
+
+
+# fromisoformat() accepts a trailing "Z" natively from Python 3.11
+_ISO_NEEDS_Z_FIX = sys.version_info < (3, 11)
+
+
+@lru_cache(maxsize=256)
+def _parse_game_time(game_time_est: str) -> datetime:
+    """Parse an ISO game time for sorting; unparseable times sort last"""
+    try:
+        if _ISO_NEEDS_Z_FIX:
+            game_time_est = game_time_est.replace("Z", "+00:00")
+        return datetime.fromisoformat(game_time_est)
+    except (AttributeError, TypeError, ValueError):
+        return datetime.max
+
+
+# Parent message header, rendered once per game with format_map()
+_PARENT_HEADER = (
+    "#{away_rank} {away_tricode} ({away_wins}-{away_losses}) {away_emoji} at "
+    "#{home_rank} {home_tricode} ({home_wins}-{home_losses}) {home_emoji} "
+    "| {game_time}{broadcaster_text}"
+)
+
+# Invariant footer sections appended to every parent message
+_GAME_FOOTER = ":notable: NOTABLES\n:mst: MILESTONES"
 
 
 class GameFormatter:
@@ -9,13 +53,19 @@ class GameFormatter:
     # Class-level cache for standings data (shared across instances)
     _standings_cache = None
 
+    # Class-level caches for rankings, keyed by season
+    _team_rankings_cache = {}
+    _player_rankings_cache = {}
+
     # Stats to show in parent message (limited set)
-    PARENT_TEAM_STATS = {"PPG", "FG%", "3P%", "BLK", "Opp PPG", "3PM"}
-    PARENT_PLAYER_STATS = {"PPG", "APG", "RPG", "FG%", "3PM", "3P%"}
+    PARENT_TEAM_STATS = frozenset({"PPG", "FG%", "3P%", "BLK", "Opp PPG", "3PM"})
+    PARENT_PLAYER_STATS = frozenset({"PPG", "APG", "RPG", "FG%", "3PM", "3P%"})
 
     # Stats to show in thread message (advanced/remaining)
-    THREAD_TEAM_STATS = {"Net RTG", "Off RTG", "Def RTG", "AST", "REB", "STL"}
-    THREAD_PLAYER_STATS = {"SPG", "BPG", "Double Doubles", "Triple Doubles"}
+    THREAD_TEAM_STATS = frozenset(
+        {"Net RTG", "Off RTG", "Def RTG", "AST", "REB", "STL"}
+    )
+    THREAD_PLAYER_STATS = frozenset({"SPG", "BPG", "Double Doubles", "Triple Doubles"})
 
     def __init__(self, nba_client, rankings_checker=None):
         """
@@ -29,38 +79,112 @@ class GameFormatter:
         self.rankings_checker = rankings_checker
         self.team_rankings = None
         self.player_rankings = None
-        self.injuries_client = InjuriesClient()
+        # Rendered rankings text per (team, allowed stats); reset by load_rankings()
+        self._team_rankings_text_cache = {}
+        self._player_rankings_text_cache = {}
+        # Reuse the NBA client's pooled session for the injury report request
+        self.injuries_client = InjuriesClient(
+            session=getattr(nba_client, "session", None)
+        )
+
+        # Date strings are constant for the run, so compute them once
+        now = datetime.now()
+        self._today_str = now.strftime("%m/%d/%Y")
+        self._current_month = now.strftime("%b").lower()
+        # (schedule payload, {MM/DD/YYYY: games}) for the last schedule extracted
+        self._games_by_date_cache = (None, {})
 
     @classmethod
     def clear_standings_cache(cls):
         """Clear the standings cache (useful for testing or forcing refresh)."""
         cls._standings_cache = None
+        cache_delete("standings")
+
+    @classmethod
+    def clear_rankings_cache(cls):
+        """Clear the rankings caches (useful for testing or forcing refresh)."""
+        cls._team_rankings_cache = {}
+        cls._player_rankings_cache = {}
+        cache_delete("rankings")
 
     def load_rankings(self, season_year: str = "2025-26"):
         """
         Fetch and cache rankings data for the day.
 
+        Team rankings, player rankings, standings, and injuries are independent
+        requests, so they are fetched concurrently; standings and injuries land in
+        their class-level caches so per-game formatting does no network I/O.
+        Rankings are cached per season (in memory, and on disk for the day), so
+        later instances and runs reuse the first fetch.
+
         Args:
             season_year: Season year (e.g., "2025-26")
         """
-        if self.rankings_checker:
-            print("Fetching team and player rankings...")
-            self.team_rankings = self.rankings_checker.get_all_top_teams(season_year)
-            self.player_rankings = self.rankings_checker.get_all_top_players(
-                season_year
-            )
-            print(
-                f"Rankings loaded: {len(self.team_rankings)} team stats, {len(self.player_rankings)} player stats"
+        if not self.rankings_checker:
+            return
+
+        self._team_rankings_text_cache = {}
+        self._player_rankings_text_cache = {}
+
+        if season_year in GameFormatter._team_rankings_cache:
+            self.team_rankings = GameFormatter._team_rankings_cache[season_year]
+            self.player_rankings = GameFormatter._player_rankings_cache[season_year]
+            self.rankings_checker.index_rankings(
+                self.team_rankings, self.player_rankings
             )
+            return
+
+        cache_name = f"rankings-{season_year}"
+        cached = cache_load(cache_name)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            executor.submit(self._create_standings_lookup)
+            executor.submit(self.injuries_client.get_all_injuries)
+            if cached is not None:
+                print("Loaded team and player rankings from disk cache")
+                self.team_rankings, self.player_rankings = cached
+                self.rankings_checker.index_rankings(
+                    self.team_rankings, self.player_rankings
+                )
+            else:
+                print("Fetching team and player rankings...")
+                teams_future = executor.submit(
+                    self.rankings_checker.get_all_top_teams, season_year
+                )
+                players_future = executor.submit(
+                    self.rankings_checker.get_all_top_players, season_year
+                )
+                self.team_rankings = teams_future.result()
+                self.player_rankings = players_future.result()
+                # Only persist complete results so a failed stat isn't cached all day
+                if all(self.team_rankings.values()) and all(
+                    self.player_rankings.values()
+                ):
+                    cache_store(cache_name, (self.team_rankings, self.player_rankings))
+
+        GameFormatter._team_rankings_cache[season_year] = self.team_rankings
+        GameFormatter._player_rankings_cache[season_year] = self.player_rankings
+        print(
+            f"Rankings loaded: {len(self.team_rankings)} team stats, {len(self.player_rankings)} player stats"
+        )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def format_time(game_time_est):
-        """Convert ISO time to readable format."""
+        """
+        Convert ISO time (e.g., "1900-01-01T19:30:00Z") to "7:30 PM ET".
+
+        Only the hour and minute are needed, so they are sliced out directly
+        rather than parsing a full datetime. Cached since games share start times.
+        """
+        if not game_time_est:
+            return "TBD"
         try:
-            dt = datetime.fromisoformat(game_time_est.replace("Z", "+00:00"))
-            return dt.strftime("%I:%M %p ET").lstrip("0")
-        except Exception:
+            hour = int(game_time_est[11:13])
+            minute = int(game_time_est[14:16])
+        except (TypeError, ValueError):
             return "TBD"
+        period = "PM" if hour >= 12 else "AM"
+        return f"{hour % 12 or 12}:{minute:02d} {period} ET"
 
     def format_games_with_threads(self, data: dict) -> list:
         """
@@ -109,12 +233,9 @@ class GameFormatter:
         if not games:
             return "No games scheduled"
 
-        formatted_games = []
-        for game in games:
-            parent_text, _, _ = self._format_game_with_thread(game, standings_lookup)
-            formatted_games.append(parent_text)
-
-        return "\n".join(formatted_games)
+        return "\n".join(
+            [self._format_game_with_thread(game, standings_lookup)[0] for game in games]
+        )
 
     def _extract_games(self, data: dict) -> list:
         """Extract games list from API response, sorted by time and broadcast status."""
@@ -125,16 +246,21 @@ class GameFormatter:
         if not league_schedule or "gameDates" not in league_schedule:
             return []
 
-        game_dates = league_schedule["gameDates"]
-        today_str = datetime.now().strftime("%m/%d/%Y")
-
-        for game_date in game_dates:
-            date_str = game_date.get("gameDate", "")
-            if today_str in date_str:
-                games = game_date.get("games", [])
-                return self._sort_games(games)
+        # gameDate looks like "10/21/2025 00:00:00"; key on the MM/DD/YYYY prefix.
+        # The index is kept for the last schedule seen, since format_games() and
+        # format_games_with_threads() may both be called with the same payload.
+        schedule_source, games_by_date = self._games_by_date_cache
+        if schedule_source is not league_schedule:
+            games_by_date = {
+                game_date.get("gameDate", "")[:10]: game_date.get("games", [])
+                for game_date in league_schedule["gameDates"]
+            }
+            self._games_by_date_cache = (league_schedule, games_by_date)
+        games = games_by_date.get(self._today_str)
+        if games is None:
+            return []
 
-        return []
+        return self._sort_games(games)
 
     def _sort_games(self, games: list) -> list:
         """
@@ -143,12 +269,8 @@ class GameFormatter:
         """
 
         def sort_key(game):
-            # Parse game time for sorting
-            game_time = game.get("gameTimeEst", "")
-            try:
-                dt = datetime.fromisoformat(game_time.replace("Z", "+00:00"))
-            except Exception:
-                dt = datetime.max  # Put unparseable times at the end
+            # Parse game time for sorting (cached; many games share a start time)
+            dt = _parse_game_time(game.get("gameTimeEst", ""))
 
             # Check for national broadcast (0 = has broadcast, 1 = no broadcast)
             broadcasters = game.get("broadcasters", {})
@@ -162,7 +284,7 @@ class GameFormatter:
     def _create_standings_lookup(self) -> dict:
         """
         Create a lookup dictionary for team standings data.
-        Uses class-level cache to avoid redundant API calls.
+        Uses class-level and daily on-disk caches to avoid redundant API calls.
 
         Returns:
             Dictionary mapping teamId to standings data
@@ -170,27 +292,48 @@ class GameFormatter:
         if GameFormatter._standings_cache is not None:
             return GameFormatter._standings_cache
 
+        # The disk cache holds the raw API payload (JSON keys are strings, so the
+        # int teamId lookup is rebuilt from it rather than stored)
+        cached = cache_load("standings")
+
         try:
-            standings_data = self.nba_client.get_team_standings()
+            if cached is not None:
+                standings_data = cached
+            else:
+                standings_data = self.nba_client.get_team_standings()
             lookup = {}
 
             teams = standings_data.get("leagueStandings", {}).get("teams", [])
-            current_month = datetime.now().strftime("%b").lower()
 
+            current_month = self._current_month
             for team in teams:
-                team_id = team.get("teamId")
-                lookup[team_id] = {
-                    "playoffRank": team.get("playoffRank", ""),
-                    "currentStreakText": team.get("currentStreakText", ""),
-                    "l10": team.get("l10", ""),
-                    "home": team.get("home", ""),
-                    "road": team.get("road", ""),
-                    "l10Home": team.get("l10Home", ""),
-                    "l10Road": team.get("l10Road", ""),
-                    "month": team.get(current_month, ""),
+                get = team.get  # bound once; every field below is optional
+                team_id = get("teamId")
+                team_data = {
+                    "playoffRank": get("playoffRank", ""),
+                    "currentStreakText": get("currentStreakText", ""),
+                    "l10": get("l10", ""),
+                    "home": get("home", ""),
+                    "road": get("road", ""),
+                    "l10Home": get("l10Home", ""),
+                    "l10Road": get("l10Road", ""),
+                    "month": get(current_month, ""),
                 }
+                # Pre-rendered standings line bodies (team emoji is prefixed per game)
+                team_data["parentLine"] = (
+                    f"{team_data['currentStreakText']} | L10: {team_data['l10']}"
+                )
+                team_data["homeLine"] = (
+                    f"Home: {team_data['home']} | L10: {team_data['l10Home']}"
+                )
+                team_data["roadLine"] = (
+                    f"Away: {team_data['road']} | L10: {team_data['l10Road']}"
+                )
+                lookup[team_id] = team_data
 
             GameFormatter._standings_cache = lookup
+            if lookup and cached is None:
+                cache_store("standings", standings_data)
             return lookup
 
         except Exception as e:
@@ -208,18 +351,15 @@ class GameFormatter:
         Returns:
             Tuple of (parent_text, thread_text, injury_thread_text)
         """
-        away_team = game.get("awayTeam", {})
-        home_team = game.get("homeTeam", {})
-
-        away_tricode = away_team.get("teamTricode", "")
-        home_tricode = home_team.get("teamTricode", "")
-        away_wins = away_team.get("wins", 0)
-        away_losses = away_team.get("losses", 0)
-        home_wins = home_team.get("wins", 0)
-        home_losses = home_team.get("losses", 0)
-
-        away_team_id = away_team.get("teamId")
-        home_team_id = home_team.get("teamId")
+        away_tricode, away_wins, away_losses, away_team_id = _team_fields(
+            game.get("awayTeam", {})
+        )
+        home_tricode, home_wins, home_losses, home_team_id = _team_fields(
+            game.get("homeTeam", {})
+        )
+        away_emoji = get_team_emoji(away_tricode)
+        home_emoji = get_team_emoji(home_tricode)
+
         away_rank = standings_lookup.get(away_team_id, {}).get("playoffRank", "")
         home_rank = standings_lookup.get(home_team_id, {}).get("playoffRank", "")
 
@@ -234,120 +374,101 @@ class GameFormatter:
             if broadcaster_display:
                 broadcaster_text = f" | {get_broadcaster_emoji(broadcaster_display)}"
 
-        # === PARENT MESSAGE ===
-        parent_lines = []
-
-        # Game header with playoff ranks
-        parent_lines.append(
-            f"#{away_rank} {away_tricode} ({away_wins}-{away_losses}) :_{away_tricode.lower()}: at "
-            f"#{home_rank} {home_tricode} ({home_wins}-{home_losses}) :_{home_tricode.lower()}: | {game_time}{broadcaster_text}"
-        )
-
-        # Standings lines (streak + L10 only in parent)
-        parent_lines.append(
-            self._format_parent_standings(away_team_id, away_tricode, standings_lookup)
-        )
-        parent_lines.append(
-            self._format_parent_standings(home_team_id, home_tricode, standings_lookup)
-        )
-
-        # Team rankings (parent stats only)
-        parent_lines.append(
-            self._format_team_rankings_filtered(
-                away_team_id, away_tricode, self.PARENT_TEAM_STATS
-            )
+        # Thread rankings are built first; they also decide the parent's thread note
+        away_thread_block = self._build_team_block(
+            away_team_id, away_tricode, self.THREAD_TEAM_STATS, self.THREAD_PLAYER_STATS
         )
-        parent_lines.append(
-            self._format_team_rankings_filtered(
-                home_team_id, home_tricode, self.PARENT_TEAM_STATS
-            )
+        home_thread_block = self._build_team_block(
+            home_team_id, home_tricode, self.THREAD_TEAM_STATS, self.THREAD_PLAYER_STATS
         )
+        has_thread_stats = any(away_thread_block) or any(home_thread_block)
 
-        # Player rankings (parent stats only)
-        parent_lines.append(
-            self._format_player_rankings_filtered(
-                away_tricode, self.PARENT_PLAYER_STATS
-            )
-        )
-        parent_lines.append(
-            self._format_player_rankings_filtered(
-                home_tricode, self.PARENT_PLAYER_STATS
-            )
-        )
-
-        # Check if there are thread stats to show
-        has_thread_stats = self._has_thread_stats(
-            away_team_id, home_team_id, away_tricode, home_tricode
-        )
-        if has_thread_stats:
-            parent_lines.append(":t10: Other Top 10s threaded")
-
-        # Footer sections
-        parent_lines.append(":notable: NOTABLES")
-        parent_lines.append(":mst: MILESTONES")
-
-        # Add injury summary to parent message
+        # === PARENT MESSAGE ===
+        # Injury summary for parent message
+        injury_text = None
         if home_team_id and away_team_id:
             try:
                 injury_text = self.injuries_client.format_game_injuries(
                     home_team_id, away_team_id
                 )
-                if injury_text:
-                    parent_lines.append(injury_text)
             except Exception as e:
                 print(f"Warning: Could not fetch injury data: {e}")
 
-        parent_text = "\n".join(line for line in parent_lines if line)
-
-        # === THREAD MESSAGE ===
-        thread_lines = []
-
-        # Thread header
-        thread_lines.append(f":_{away_tricode.lower()}: @ :_{home_tricode.lower()}:")
-
-        # Home/Away records with L10
-        thread_lines.append(
-            self._format_thread_standings(
-                away_team_id, away_tricode, standings_lookup, is_home=False
-            )
-        )
-        thread_lines.append(
-            self._format_thread_standings(
-                home_team_id, home_tricode, standings_lookup, is_home=True
-            )
-        )
-
-        # Team rankings (thread/advanced stats only)
-        thread_lines.append(
-            self._format_team_rankings_filtered(
-                away_team_id, away_tricode, self.THREAD_TEAM_STATS
-            )
-        )
-        thread_lines.append(
-            self._format_team_rankings_filtered(
-                home_team_id, home_tricode, self.THREAD_TEAM_STATS
+        # Helpers return "" when there is nothing to show; filter(None) drops them
+        parent_text = "\n".join(
+            filter(
+                None,
+                (
+                    # Game header with playoff ranks
+                    _PARENT_HEADER.format_map(
+                        {
+                            "away_rank": away_rank,
+                            "away_tricode": away_tricode,
+                            "away_wins": away_wins,
+                            "away_losses": away_losses,
+                            "away_emoji": away_emoji,
+                            "home_rank": home_rank,
+                            "home_tricode": home_tricode,
+                            "home_wins": home_wins,
+                            "home_losses": home_losses,
+                            "home_emoji": home_emoji,
+                            "game_time": game_time,
+                            "broadcaster_text": broadcaster_text,
+                        }
+                    ),
+                    # Standings lines (streak + L10 only in parent)
+                    self._format_parent_standings(
+                        away_team_id, away_emoji, standings_lookup
+                    ),
+                    self._format_parent_standings(
+                        home_team_id, home_emoji, standings_lookup
+                    ),
+                    # Team rankings, then player rankings (parent stats only)
+                    *chain.from_iterable(
+                        zip(
+                            self._build_team_block(
+                                away_team_id,
+                                away_tricode,
+                                self.PARENT_TEAM_STATS,
+                                self.PARENT_PLAYER_STATS,
+                            ),
+                            self._build_team_block(
+                                home_team_id,
+                                home_tricode,
+                                self.PARENT_TEAM_STATS,
+                                self.PARENT_PLAYER_STATS,
+                            ),
+                        )
+                    ),
+                    ":t10: Other Top 10s threaded" if has_thread_stats else None,
+                    _GAME_FOOTER,
+                    injury_text,
+                ),
             )
         )
 
-        # Player rankings (thread stats only)
-        thread_lines.append(
-            self._format_player_rankings_filtered(
-                away_tricode, self.THREAD_PLAYER_STATS
-            )
-        )
-        thread_lines.append(
-            self._format_player_rankings_filtered(
-                home_tricode, self.THREAD_PLAYER_STATS
+        # === THREAD MESSAGE ===
+        # Only build thread text if there's meaningful content beyond the standings
+        thread_text = None
+        if has_thread_stats:
+            thread_text = "\n".join(
+                filter(
+                    None,
+                    (
+                        # Thread header
+                        f"{away_emoji} @ {home_emoji}",
+                        # Home/Away records with L10
+                        self._format_thread_standings(
+                            away_team_id, away_emoji, standings_lookup, is_home=False
+                        ),
+                        self._format_thread_standings(
+                            home_team_id, home_emoji, standings_lookup, is_home=True
+                        ),
+                        # Team rankings, then player rankings (thread stats only)
+                        *chain.from_iterable(zip(away_thread_block, home_thread_block)),
+                    ),
+                )
             )
-        )
-
-        thread_text = "\n".join(line for line in thread_lines if line)
-
-        # Only return thread text if there's meaningful content
-        has_content = any(
-            line.strip() and not line.startswith(":_")
-            for line in thread_lines[3:]  # Skip header and standings lines
-        )
 
         # === INJURY THREAD MESSAGE ===
         injury_thread = None
@@ -359,40 +480,48 @@ class GameFormatter:
             except Exception as e:
                 print(f"Warning: Could not format injury thread: {e}")
 
-        return parent_text, thread_text if has_content else None, injury_thread
+        return parent_text, thread_text, injury_thread
+
+    def _build_team_block(
+        self, team_id, team_tricode: str, team_stats: set, player_stats: set
+    ) -> tuple:
+        """
+        Build one team's rankings lines for a message section.
+
+        Args:
+            team_id: Team ID
+            team_tricode: Team tricode (e.g., "ATL")
+            team_stats: Set of team stat names to include
+            player_stats: Set of player stat names to include
+
+        Returns:
+            Tuple of (team_rankings_text, player_rankings_text); either may be ""
+        """
+        return (
+            self._format_team_rankings_filtered(team_id, team_tricode, team_stats),
+            self._format_player_rankings_filtered(team_tricode, player_stats),
+        )
 
     def _format_parent_standings(
-        self, team_id: int, team_tricode: str, standings_lookup: dict
+        self, team_id: int, team_emoji: str, standings_lookup: dict
     ) -> str:
         """Format standings line for parent message (streak + L10)."""
-        if team_id not in standings_lookup:
+        team_data = standings_lookup.get(team_id)
+        if team_data is None:
             return ""
 
-        team_data = standings_lookup[team_id]
-        streak = team_data.get("currentStreakText", "")
-        l10 = team_data.get("l10", "")
-
-        return f":_{team_tricode.lower()}: {streak} | L10: {l10}"
+        return f"{team_emoji} {team_data['parentLine']}"
 
     def _format_thread_standings(
-        self, team_id: int, team_tricode: str, standings_lookup: dict, is_home: bool
+        self, team_id: int, team_emoji: str, standings_lookup: dict, is_home: bool
     ) -> str:
         """Format standings line for thread message (home/away record + L10)."""
-        if team_id not in standings_lookup:
+        team_data = standings_lookup.get(team_id)
+        if team_data is None:
             return ""
 
-        team_data = standings_lookup[team_id]
-
-        if is_home:
-            record = team_data.get("home", "")
-            l10_record = team_data.get("l10Home", "")
-            location = "Home"
-        else:
-            record = team_data.get("road", "")
-            l10_record = team_data.get("l10Road", "")
-            location = "Away"
-
-        return f":_{team_tricode.lower()}: {location}: {record} | L10: {l10_record}"
+        line_key = "homeLine" if is_home else "roadLine"
+        return f"{team_emoji} {team_data[line_key]}"
 
     def _format_team_rankings_filtered(
         self, team_id: str, team_tricode: str, allowed_stats: set
@@ -408,37 +537,41 @@ class GameFormatter:
         Returns:
             Formatted rankings string
         """
+        team_id = str(team_id)
+        cache_key = (team_id, team_tricode, allowed_stats)
+        text = self._team_rankings_text_cache.get(cache_key)
+        if text is None:
+            text = self._render_team_rankings(team_id, team_tricode, allowed_stats)
+            self._team_rankings_text_cache[cache_key] = text
+        return text
+
+    def _render_team_rankings(
+        self, team_id: str, team_tricode: str, allowed_stats: set
+    ) -> str:
+        """Render team rankings text (uncached version of the method above)."""
         if not self.rankings_checker or not self.team_rankings:
             return ""
 
+        # Already ordered by rank, with display text rendered by the index
         team_ranks = self.rankings_checker.get_team_rankings(
-            str(team_id), self.team_rankings
+            team_id, self.team_rankings
         )
 
-        if not team_ranks:
-            return ""
-
         # Filter to allowed stats
         filtered_ranks = [r for r in team_ranks if r["stat"] in allowed_stats]
 
         if not filtered_ranks:
             return ""
 
-        stat_parts = []
-        for rank_info in filtered_ranks:
-            stat_parts.append(
-                f"#{rank_info['rank']} in {rank_info['stat']} ({rank_info['value']:.1f})"
-            )
-
-        stats_text = ", ".join(stat_parts)
+        stats_text = ", ".join([rank_info["text"] for rank_info in filtered_ranks])
         return f":t10: {team_tricode} ranks {stats_text}"
 
     # Stat groupings for player display formatting (in display order)
-    PLAYER_STAT_GROUPS = [
-        ["PPG", "RPG", "APG"],  # PTS, REB, AST
-        ["FG%", "3P%", "3PM"],  # FG%, 3P%, 3PM
-        ["SPG", "BPG"],  # STL, BLK
-    ]
+    PLAYER_STAT_GROUPS = (
+        ("PPG", "RPG", "APG"),  # PTS, REB, AST
+        ("FG%", "3P%", "3PM"),  # FG%, 3P%, 3PM
+        ("SPG", "BPG"),  # STL, BLK
+    )
 
     def _format_player_rankings_filtered(
         self, team_tricode: str, allowed_stats: set
@@ -453,6 +586,15 @@ class GameFormatter:
         Returns:
             Formatted player rankings string
         """
+        cache_key = (team_tricode, allowed_stats)
+        text = self._player_rankings_text_cache.get(cache_key)
+        if text is None:
+            text = self._render_player_rankings(team_tricode, allowed_stats)
+            self._player_rankings_text_cache[cache_key] = text
+        return text
+
+    def _render_player_rankings(self, team_tricode: str, allowed_stats: set) -> str:
+        """Render player rankings text (uncached version of the method above)."""
         if not self.rankings_checker or not self.player_rankings:
             return ""
 
@@ -460,52 +602,23 @@ class GameFormatter:
             team_tricode, self.player_rankings
         )
 
-        if not player_ranks:
-            return ""
-
-        # Filter to allowed stats
-        filtered_ranks = [r for r in player_ranks if r["stat"] in allowed_stats]
-
-        if not filtered_ranks:
-            return ""
-
-        # Group by player
+        # Filter to allowed stats, grouped by player
         player_stats = {}
-        for rank_info in filtered_ranks:
-            player_name = rank_info["playerName"]
-            if player_name not in player_stats:
-                player_stats[player_name] = {}
-            player_stats[player_name][rank_info["stat"]] = rank_info
+        for rank_info in player_ranks:
+            stat = rank_info["stat"]
+            if stat in allowed_stats:
+                player_stats.setdefault(rank_info["playerName"], {})[stat] = rank_info
 
-        # Stats that are totals (no decimal places)
-        totals_stats = {"Double Doubles", "Triple Doubles"}
+        if not player_stats:
+            return ""
 
         lines = []
-        for player_name in sorted(player_stats.keys()):
-            stats = player_stats[player_name]
-
+        for player_name, stats in sorted(player_stats.items()):
             # Build lines for each stat group
             for stat_group in self.PLAYER_STAT_GROUPS:
-                group_parts = []
-                for stat in stat_group:
-                    if stat in stats:
-                        rank_info = stats[stat]
-                        value = rank_info["value"]
-
-                        # Percentage stats need to be multiplied by 100
-                        if stat in ["FG%", "3P%"]:
-                            value = value * 100
-
-                        # Format value based on stat type
-                        if stat in totals_stats:
-                            value_str = f"{value:.0f}"
-                        else:
-                            value_str = f"{value:.1f}"
-
-                        group_parts.append(
-                            f"#{rank_info['rank']} in {stat} ({value_str})"
-                        )
-
+                group_parts = [
+                    stats[stat]["text"] for stat in stat_group if stat in stats
+                ]
                 if group_parts:
                     stats_text = ", ".join(group_parts)
                     lines.append(
@@ -514,31 +627,6 @@ class GameFormatter:
 
         return "\n".join(lines)
 
-    def _has_thread_stats(
-        self, away_team_id, home_team_id, away_tricode, home_tricode
-    ) -> bool:
-        """Check if there are any thread stats to display."""
-        if not self.rankings_checker:
-            return False
-
-        # Check team thread stats
-        for team_id in [away_team_id, home_team_id]:
-            team_ranks = self.rankings_checker.get_team_rankings(
-                str(team_id), self.team_rankings or {}
-            )
-            if any(r["stat"] in self.THREAD_TEAM_STATS for r in team_ranks):
-                return True
-
-        # Check player thread stats
-        for tricode in [away_tricode, home_tricode]:
-            player_ranks = self.rankings_checker.get_player_rankings_for_team(
-                tricode, self.player_rankings or {}
-            )
-            if any(r["stat"] in self.THREAD_PLAYER_STATS for r in player_ranks):
-                return True
-
-        return False
-
     def _format_single_game(self, game: dict, standings_lookup: dict) -> str:
         """
         Format a single game (legacy method for compatibility).
@@ -2,12 +2,22 @@
 Injuries module for fetching and formatting NBA injury data.
 """
 
+import orjson
 import requests
 import os
 from datetime import datetime
 from typing import Dict, List
 
-from .mapping import PLAYERS_EXCLUDED
+from .disk_cache import cache_load, cache_store
+from .mapping import PLAYERS_EXCLUDED, get_team_emoji
+from .nba_api import get_shared_session
+
+# Injury statuses shown in the GTD/QUESTIONABLE and OUT sections
+_GTD_STATUSES = frozenset(("GTD", "QUESTIONABLE", "DOUBTFUL"))
+_OUT_STATUSES = frozenset(("OUT",))
+
+# Injury reports change through the day, so the disk cache expires quickly
+_INJURY_CACHE_TTL_MIN = 10
 
 
 class InjuriesClient:
@@ -15,8 +25,17 @@ class InjuriesClient:
 
     # Class-level cache to persist across instances
     _shared_injury_cache = None
+    # Per-team index of preprocessed injury records, built from the cache above
+    _shared_team_index = None
+
+    def __init__(self, session: requests.Session = None):
+        """
+        Initialize injuries client.
 
-    def __init__(self):
+        Args:
+            session: Optional requests.Session (defaults to the shared session)
+        """
+        self.session = session or get_shared_session()
         self.base_url = "https://api.nba.com/v0/api/stats/injury"
         self.api_key = os.getenv("STATS_API_KEY")
 
@@ -37,6 +56,14 @@ class InjuriesClient:
         if InjuriesClient._shared_injury_cache is not None:
             return InjuriesClient._shared_injury_cache
 
+        # Then a recent copy from a previous run (on-disk cache)
+        cache_name = f"injuries-{league_id}"
+        cached = cache_load(cache_name, ttl_minutes=_INJURY_CACHE_TTL_MIN)
+        if cached is not None:
+            InjuriesClient._shared_injury_cache = cached
+            InjuriesClient._shared_team_index = self._build_team_index(cached)
+            return cached
+
         headers = {
             "X-NBA-Api-Key": self.api_key,  # Changed from 'Authorization': 'Bearer ...'
             "Accept": "application/json",
@@ -45,49 +72,89 @@ class InjuriesClient:
         params = {"leagueId": league_id}
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, headers=headers, params=params, timeout=10
             )
             response.raise_for_status()
-            InjuriesClient._shared_injury_cache = response.json()
+            InjuriesClient._shared_injury_cache = orjson.loads(response.content)
+            InjuriesClient._shared_team_index = self._build_team_index(
+                InjuriesClient._shared_injury_cache
+            )
+            cache_store(cache_name, InjuriesClient._shared_injury_cache)
             return InjuriesClient._shared_injury_cache
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching injury data: {e}")
             return {"leagueId": league_id, "players": []}
 
-    def get_injuries_by_team(self, team_id: int) -> Dict[str, List[str]]:
+    @staticmethod
+    def _build_team_index(all_injuries: Dict) -> Dict[int, List[Dict]]:
         """
-        Get injuries for a specific team, grouped by status.
+        Group injury records by team in a single pass over the league list.
+
+        Excluded players are dropped and each record gets a precomputed 'bucket'
+        ("GTD", "OUT", or None) so per-team lookups never rescan or re-uppercase,
+        plus its rendered "Player - Type (Status)" 'line' for the report loops.
 
         Args:
-            team_id: NBA team ID
+            all_injuries: Injury data as returned by get_all_injuries
 
         Returns:
-            Dictionary with 'GTD' and 'OUT' keys containing lists of player names
+            Dictionary mapping team ID to a list of injury info dicts
         """
-        all_injuries = self.get_all_injuries()
+        team_index = {}
+        for player in (all_injuries or {}).get("players", []):
+            player_name = player.get("playerName", "")
+            # Skip excluded players
+            if player_name in PLAYERS_EXCLUDED:
+                continue
+            injury_status = player.get("injuryStatus", "")
+            injury_type = player.get("injuryType", "")
+            status = injury_status.upper()
+            if status in _GTD_STATUSES:
+                bucket = "GTD"
+            elif status in _OUT_STATUSES:
+                bucket = "OUT"
+            else:
+                bucket = None
+            team_index.setdefault(player.get("teamId"), []).append(
+                {
+                    "playerName": player_name,
+                    "injuryStatus": injury_status,
+                    "injuryType": injury_type,
+                    "injuryLocation": player.get("injuryLocation", ""),
+                    "injuryDetails": player.get("injuryDetails", ""),
+                    "teamAbbreviation": player.get("teamAbbreviation", ""),
+                    "bucket": bucket,
+                    "line": f"{player_name} - {injury_type} ({injury_status})",
+                }
+            )
+        return team_index
 
-        if not all_injuries or "players" not in all_injuries:
-            return {"GTD": [], "OUT": []}
+    def _get_team_index(self) -> Dict[int, List[Dict]]:
+        """Return the per-team injury index, fetching injuries if needed."""
+        all_injuries = self.get_all_injuries()
+        if InjuriesClient._shared_team_index is not None:
+            return InjuriesClient._shared_team_index
+        # Fetch failed (not cached); index the fallback without caching it
+        return self._build_team_index(all_injuries)
 
-        gtd_players = []
-        out_players = []
+    def get_injuries_by_team(self, team_id: int) -> Dict[str, List[str]]:
+        """
+        Get injuries for a specific team, grouped by status.
 
-        for player in all_injuries["players"]:
-            if player.get("teamId") == team_id:
-                player_name = player.get("playerName", "")
-                # Skip excluded players
-                if player_name in PLAYERS_EXCLUDED:
-                    continue
-                injury_status = player.get("injuryStatus", "").upper()
+        Args:
+            team_id: NBA team ID
 
-                if injury_status in ["GTD", "QUESTIONABLE", "DOUBTFUL"]:
-                    gtd_players.append(player_name)
-                elif injury_status in ["OUT"]:
-                    out_players.append(player_name)
+        Returns:
+            Dictionary with 'GTD' and 'OUT' keys containing lists of player names
+        """
+        team_injuries = self._get_team_index().get(team_id, [])
 
-        return {"GTD": gtd_players, "OUT": out_players}
+        return {
+            "GTD": [i["playerName"] for i in team_injuries if i["bucket"] == "GTD"],
+            "OUT": [i["playerName"] for i in team_injuries if i["bucket"] == "OUT"],
+        }
 
     def get_detailed_injuries_by_team(self, team_id: int) -> List[Dict]:
         """
@@ -99,30 +166,7 @@ class InjuriesClient:
         Returns:
             List of dictionaries with detailed player injury info
         """
-        all_injuries = self.get_all_injuries()
-
-        if not all_injuries or "players" not in all_injuries:
-            return []
-
-        team_injuries = []
-
-        for player in all_injuries["players"]:
-            if player.get("teamId") == team_id:
-                player_name = player.get("playerName", "")
-                # Skip excluded players
-                if player_name in PLAYERS_EXCLUDED:
-                    continue
-                injury_info = {
-                    "playerName": player_name,
-                    "injuryStatus": player.get("injuryStatus", ""),
-                    "injuryType": player.get("injuryType", ""),
-                    "injuryLocation": player.get("injuryLocation", ""),
-                    "injuryDetails": player.get("injuryDetails", ""),
-                    "teamAbbreviation": player.get("teamAbbreviation", ""),
-                }
-                team_injuries.append(injury_info)
-
-        return team_injuries
+        return self._get_team_index().get(team_id, [])
 
     def format_game_injuries(self, home_team_id: int, away_team_id: int) -> str:
         """
@@ -136,46 +180,32 @@ class InjuriesClient:
         Returns:
             Formatted injury string with GTD and OUT sections
         """
-        away_injuries = self.get_injuries_by_team(away_team_id)
-        home_injuries = self.get_injuries_by_team(home_team_id)
+        # Nothing to format when the league has no (non-excluded) injuries
+        team_index = self._get_team_index()
+        if not team_index:
+            return ""
 
-        lines = []
+        # Walk each team's records once, grouping names by bucket and side
+        names = {"GTD": ([], []), "OUT": ([], [])}
+        for side, team_id in enumerate((away_team_id, home_team_id)):
+            for injury in team_index.get(team_id, ()):
+                bucket = injury["bucket"]
+                if bucket:
+                    names[bucket][side].append(injury["playerName"])
 
-        # GTD/QUESTIONABLE section - away first, then pipe, then home
-        away_gtd = away_injuries["GTD"]
-        home_gtd = home_injuries["GTD"]
-        if away_gtd or home_gtd:
-            gtd_parts = []
-            if away_gtd:
-                gtd_parts.append(", ".join(away_gtd))
-            if home_gtd:
-                gtd_parts.append(", ".join(home_gtd))
-            gtd_names = (
-                " | ".join(gtd_parts)
-                if len(gtd_parts) > 1
-                else gtd_parts[0]
-                if gtd_parts
-                else ""
-            )
-            lines.append(f":gtd: {gtd_names}")
-
-        # OUT section - away first, then pipe, then home
-        away_out = away_injuries["OUT"]
-        home_out = home_injuries["OUT"]
-        if away_out or home_out:
-            out_parts = []
-            if away_out:
-                out_parts.append(", ".join(away_out))
-            if home_out:
-                out_parts.append(", ".join(home_out))
-            out_names = (
-                " | ".join(out_parts)
-                if len(out_parts) > 1
-                else out_parts[0]
-                if out_parts
-                else ""
-            )
-            lines.append(f":out: {out_names}")
+        # GTD/QUESTIONABLE then OUT - away first, then pipe, then home
+        lines = []
+        for bucket, emoji in (("GTD", ":gtd:"), ("OUT", ":out:")):
+            away_names, home_names = names[bucket]
+            away_str = ", ".join(away_names)
+            home_str = ", ".join(home_names)
+            if away_str or home_str:
+                joined = (
+                    away_str + " | " + home_str
+                    if away_str and home_str
+                    else away_str or home_str
+                )
+                lines.append(f"{emoji} {joined}")
 
         return "\n".join(lines)
 
@@ -194,6 +224,9 @@ class InjuriesClient:
         Returns:
             Formatted detailed injury thread string
         """
+        if not self._get_team_index():
+            return ""
+
         away_injuries = (
             self.get_detailed_injuries_by_team(away_team_id) if away_team_id else []
         )
@@ -213,46 +246,30 @@ class InjuriesClient:
         gtd_injuries = []
         out_injuries = []
 
-        for injury in away_injuries:
-            injury["tricode"] = away_tricode
-            status = injury["injuryStatus"].upper()
-            if status in ["GTD", "QUESTIONABLE", "DOUBTFUL"]:
-                gtd_injuries.append(injury)
-            elif status == "OUT":
-                out_injuries.append(injury)
-
-        for injury in home_injuries:
-            injury["tricode"] = home_tricode
-            status = injury["injuryStatus"].upper()
-            if status in ["GTD", "QUESTIONABLE", "DOUBTFUL"]:
-                gtd_injuries.append(injury)
-            elif status == "OUT":
-                out_injuries.append(injury)
+        # Records are shared via the team index, so pair them with the team
+        # emoji (resolved once per team) instead of tagging them in place
+        for team_emoji, injuries in (
+            (get_team_emoji(away_tricode), away_injuries),
+            (get_team_emoji(home_tricode), home_injuries),
+        ):
+            for injury in injuries:
+                if injury["bucket"] == "GTD":
+                    gtd_injuries.append((team_emoji, injury))
+                elif injury["bucket"] == "OUT":
+                    out_injuries.append((team_emoji, injury))
 
         # GTD/QUESTIONABLE section
         if gtd_injuries:
             lines.append(":gtd: *GTD/QUESTIONABLE*")
-            for injury in gtd_injuries:
-                tricode = injury["tricode"]
-                player_name = injury["playerName"]
-                injury_type = injury["injuryType"]
-                injury_status = injury["injuryStatus"]
-                lines.append(
-                    f":_{tricode.lower()}: {player_name} - {injury_type} ({injury_status})"
-                )
+            for team_emoji, injury in gtd_injuries:
+                lines.append(f"{team_emoji} {injury['line']}")
             lines.append("")
 
         # OUT section
         if out_injuries:
             lines.append(":out: *OUT*")
-            for injury in out_injuries:
-                tricode = injury["tricode"]
-                player_name = injury["playerName"]
-                injury_type = injury["injuryType"]
-                injury_status = injury["injuryStatus"]
-                lines.append(
-                    f":_{tricode.lower()}: {player_name} - {injury_type} ({injury_status})"
-                )
+            for team_emoji, injury in out_injuries:
+                lines.append(f"{team_emoji} {injury['line']}")
 
         return "\n".join(lines)
 
@@ -266,6 +283,9 @@ class InjuriesClient:
         Returns:
             Formatted detailed injury report string
         """
+        if not self._get_team_index():
+            return ""
+
         report_lines = ["━━━━━━━━━━━━━━━━━━━━━━", "*Full Injury Report*"]
 
         for game in games:
@@ -287,32 +307,20 @@ class InjuriesClient:
 
             # Only add section if there are injuries
             if away_injuries or home_injuries:
-                game_header = f"\n{away_tricode} :_{away_tricode.lower()}: @ {home_tricode} :_{home_tricode.lower()}:"
+                away_emoji = get_team_emoji(away_tricode)
+                home_emoji = get_team_emoji(home_tricode)
+                game_header = (
+                    f"\n{away_tricode} {away_emoji} @ {home_tricode} {home_emoji}"
+                )
                 report_lines.append(game_header)
 
-                # Combine both teams' injuries into one list
-                all_injuries = []
-
-                # Away team injuries
-                for injury in away_injuries:
-                    player_name = injury["playerName"]
-                    injury_type = injury["injuryType"]
-                    injury_status = injury["injuryStatus"]
-                    all_injuries.append(
-                        f":_{away_tricode.lower()}: {player_name} - {injury_type} ({injury_status})"
-                    )
-
-                # Home team injuries
-                for injury in home_injuries:
-                    player_name = injury["playerName"]
-                    injury_type = injury["injuryType"]
-                    injury_status = injury["injuryStatus"]
-                    all_injuries.append(
-                        f":_{home_tricode.lower()}: {player_name} - {injury_type} ({injury_status})"
-                    )
-
-                # Add all injuries for this game
-                report_lines.extend(all_injuries)
+                # Away team injuries, then home team injuries
+                report_lines.extend(
+                    f"{away_emoji} {injury['line']}" for injury in away_injuries
+                )
+                report_lines.extend(
+                    f"{home_emoji} {injury['line']}" for injury in home_injuries
+                )
 
         # If no injuries at all, return empty string
         if len(report_lines) <= 2:
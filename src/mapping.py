@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 # Mapping of NBA API broadcaster names to Slack emoji names
 BROADCASTER_EMOJI_MAP = {
     "NBA TV": "NBATV",
@@ -11,12 +13,26 @@ BROADCASTER_EMOJI_MAP = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_broadcaster_emoji(broadcaster_name):
     """Convert broadcaster display name to Slack emoji format"""
-    emoji_name = BROADCASTER_EMOJI_MAP.get(
-        broadcaster_name, broadcaster_name.replace(" ", "")
-    )
+    emoji_name = BROADCASTER_EMOJI_MAP.get(broadcaster_name)
+    if emoji_name is None:
+        # Unmapped names fall back to the name with spaces removed
+        emoji_name = broadcaster_name.replace(" ", "")
     return f":_{emoji_name}:"
 
 
-PLAYERS_EXCLUDED = {"Terry Rozier", "Jayson Tatum"}
+# Cache of team tricode -> Slack emoji token (e.g., "BOS" -> ":_bos:")
+_TEAM_EMOJI = {}
+
+
+def get_team_emoji(tricode):
+    """Convert team tricode to its Slack emoji token, cached per tricode"""
+    emoji = _TEAM_EMOJI.get(tricode)
+    if emoji is None:
+        emoji = _TEAM_EMOJI[tricode] = f":_{tricode.lower()}:"
+    return emoji
+
+
+PLAYERS_EXCLUDED = frozenset({"Terry Rozier", "Jayson Tatum"})
@@ -1,10 +1,88 @@
+import orjson
 import requests
-from datetime import datetime
+import threading
+from datetime import date
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .config import Config
 
 
+def create_session() -> requests.Session:
+    """
+    Create a requests session with a pooled, retrying HTTPS adapter.
+
+    Sharing one session across clients keeps connections to api.nba.com alive
+    between calls instead of repeating the TCP/TLS handshake for each request.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+    )
+    # Peak fan-out is one request per team stat (11) and player stat (8), plus
+    # standings, injuries and the schedule (22); leave headroom above that
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Return the process-wide default session, creating it on first use.
+
+    Clients constructed without an explicit session use this one, so separate
+    NBAClient/RankingsChecker/InjuriesClient instances still share a pool.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+@lru_cache(maxsize=4)
+def _season_for_date(day: date) -> str:
+    """Season string (e.g., "2025-26") for a date; seasons start in October."""
+    start_year = day.year if day.month >= 10 else day.year - 1
+    return f"{start_year}-{str(start_year + 1)[-2:]}"
+
+
+@lru_cache(maxsize=64)
+def _sort_column(stat_name: str) -> str:
+    """Query tool sortColumn (e.g., "PTS_PG|DESC") for a request stat name."""
+    # Import here to avoid circular dependency
+    from .rankings import RankingsChecker
+
+    # Use the response key for sortColumn (e.g., "OPP_PTS_PG" for "OPP_PTS")
+    # If no mapping exists, extract the stat name (e.g., "PTS" from "BASE_PTS")
+    sort_stat = RankingsChecker.TEAM_STAT_RESPONSE_KEYS.get(stat_name)
+    if sort_stat is None:
+        sort_stat = stat_name.split("_", 1)[-1]
+
+    # Check if this stat should be sorted ascending (lower is better)
+    sort_order = "ASC" if stat_name in RankingsChecker.TEAM_STATS_ASCENDING else "DESC"
+    return f"{sort_stat}|{sort_order}"
+
+
 class NBAClient:
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
+        """
+        Initialize NBA API client.
+
+        Args:
+            session: Optional requests.Session (defaults to the shared session)
+        """
+        self.session = session or get_shared_session()
         self.api_key = Config.NBA_API_KEY
         self.alerts_api_key = Config.NBA_ALERTS_API_KEY
         self.standings_key = Config.NBA_STANDINGS_KEY
@@ -12,17 +90,29 @@ class NBAClient:
         self.stats_key = Config.STATS_API_KEY
         self.base_url = Config.NBA_API_BASE
 
+    def _get_json(self, url: str, headers: dict, params: dict, timeout=10) -> dict:
+        """
+        GET a JSON endpoint and decode the response.
+
+        Args:
+            url: Endpoint URL
+            headers: Request headers (API key)
+            params: Query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Parsed JSON response
+        """
+        response = self.session.get(
+            url, headers=headers, params=params, timeout=timeout
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def get_todays_games(self):
         """Fetch today's NBA games"""
-        # Get current season (e.g., "2025-26")
-        now = datetime.now()
-        current_year = now.year
-        current_month = now.month
-
-        if current_month >= 10:
-            season = f"{current_year}-{str(current_year + 1)[-2:]}"
-        else:  # Before October
-            season = f"{current_year - 1}-{str(current_year)[-2:]}"
+        # Get current season (e.g., "2025-26"), cached per calendar day
+        season = _season_for_date(date.today())
 
         url = f"{self.base_url}/api/schedule/full"
         headers = {"X-NBA-Api-Key": self.api_key}
@@ -32,10 +122,8 @@ class NBAClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self._get_json(url, headers, params)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Failed to fetch NBA games: {e}")
 
     def get_team_standings(
@@ -59,10 +147,7 @@ class NBAClient:
             "seasonType": season_type,
         }
 
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json(url, headers, params)
 
     def get_top_teams_by_stat(
         self, stat_name: str, limit: int = 10, season_year: str = "2025-26"
@@ -81,20 +166,6 @@ class NBAClient:
         url = f"{self.base_url}/api/querytool/season/team"
         headers = {"X-NBA-Api-Key": self.query_tool_key}
 
-        # Import here to avoid circular dependency
-        from .rankings import RankingsChecker
-
-        # Use the response key for sortColumn (e.g., "OPP_PTS_PG" for "OPP_PTS")
-        # If no mapping exists, extract the stat name (e.g., "PTS" from "BASE_PTS")
-        sort_stat = RankingsChecker.TEAM_STAT_RESPONSE_KEYS.get(
-            stat_name, stat_name.split("_", 1)[-1] if "_" in stat_name else stat_name
-        )
-
-        # Check if this stat should be sorted ascending (lower is better)
-        sort_order = (
-            "ASC" if stat_name in RankingsChecker.TEAM_STATS_ASCENDING else "DESC"
-        )
-
         params = {
             "measures": stat_name,
             "leagueId": Config.LEAGUE_ID,
@@ -102,15 +173,13 @@ class NBAClient:
             "seasonType": "Regular Season",
             "perMode": "PerGame",
             "Grouping": "None",
-            "sortColumn": f"{sort_stat}|{sort_order}",
+            "sortColumn": _sort_column(stat_name),
             "MaxRowsReturned": limit,
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self._get_json(url, headers, params)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Failed to fetch team stats for {stat_name}: {e}")
 
     def get_top_players_by_stat(
@@ -144,10 +213,8 @@ class NBAClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self._get_json(url, headers, params)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Failed to fetch player leaders for {stat_category}: {e}")
 
     def get_query_players_by_stat(
@@ -167,17 +234,6 @@ class NBAClient:
         url = f"{self.base_url}/api/querytool/season/player"
         headers = {"X-NBA-Api-Key": self.query_tool_key}
 
-        from .rankings import RankingsChecker
-
-        sort_stat = RankingsChecker.TEAM_STAT_RESPONSE_KEYS.get(
-            stat_name, stat_name.split("_", 1)[-1] if "_" in stat_name else stat_name
-        )
-
-        # Check if this stat should be sorted ascending (lower is better)
-        sort_order = (
-            "ASC" if stat_name in RankingsChecker.TEAM_STATS_ASCENDING else "DESC"
-        )
-
         params = {
             "measures": stat_name,
             "leagueId": Config.LEAGUE_ID,
@@ -185,13 +241,11 @@ class NBAClient:
             "seasonType": "Regular Season",
             "perMode": "Totals",
             "Grouping": "None",
-            "sortColumn": f"{sort_stat}|{sort_order}",
+            "sortColumn": _sort_column(stat_name),
             "MaxRowsReturned": limit,
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self._get_json(url, headers, params)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Failed to fetch team stats for {stat_name}: {e}")
@@ -1,17 +1,37 @@
 # src/rankings.py
 from typing import Dict, List
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from types import MappingProxyType
 from .nba_api import NBAClient
 
+# Sort key for player rankings: rank, then player name for ties
+_BY_RANK_NAME = itemgetter("rank", "playerName")
+
+# Shared read-only default for rows without a "stats" object (avoids a new {})
+_NO_STATS = MappingProxyType({})
+
+# Player stat display: stat -> (multiplier, value format). Percentages come back
+# as fractions; totals show no decimal places; everything else uses one decimal.
+_PLAYER_STAT_FORMAT_DEFAULT = (1, "{:.1f}")
+_PLAYER_STAT_FORMATS = {
+    "FG%": (100, "{:.1f}"),
+    "3P%": (100, "{:.1f}"),
+    "Double Doubles": (1, "{:.0f}"),
+    "Triple Doubles": (1, "{:.0f}"),
+}
+
 
 class RankingsChecker:
     """Handles fetching and checking NBA rankings for teams and players"""
 
     # Stats where lower values are better (sorted ascending)
-    TEAM_STATS_ASCENDING = {
-        "ADV_TM_DEF_RATING",  # Lower defensive rating is better
-        "OPP_PTS",  # Lower opponent points is better
-    }
+    TEAM_STATS_ASCENDING = frozenset(
+        {
+            "ADV_TM_DEF_RATING",  # Lower defensive rating is better
+            "OPP_PTS",  # Lower opponent points is better
+        }
+    )
 
     # Stat groupings for display formatting
     TEAM_STAT_GROUPS = {
@@ -93,8 +113,14 @@ class RankingsChecker:
         "FG3_PCT": "FG3_PCT",
     }
 
-    def __init__(self):
-        self.client = NBAClient()
+    def __init__(self, session=None):
+        """
+        Initialize rankings checker.
+
+        Args:
+            session: Optional shared requests.Session for the underlying NBAClient
+        """
+        self.client = NBAClient(session=session)
         self.team_stats = list(self.TEAM_STAT_NAMES.keys())
         self.player_stats = list(self.PLAYER_STAT_NAMES.keys())
         # Index for O(1) team lookups: team_id -> {stat: rank_info}
@@ -111,19 +137,20 @@ class RankingsChecker:
             teams_data = response.get("teams", [])
             response_stat_key = self.TEAM_STAT_RESPONSE_KEYS.get(stat, stat)
 
-            teams = []
-            for rank, team in enumerate(teams_data, start=1):
-                teams.append(
-                    {
-                        "teamId": str(team.get("teamId")),
-                        "teamName": team.get("teamName", ""),
-                        "teamTricode": team.get("teamTricode", ""),
-                        "rank": rank,
-                        "value": team.get("stats", {}).get(response_stat_key, 0),
-                    }
-                )
+            teams = [
+                {
+                    "teamId": str(team.get("teamId")),
+                    "teamName": team.get("teamName", ""),
+                    "teamTricode": team.get("teamTricode", ""),
+                    "rank": rank,
+                    "value": team.get("stats", _NO_STATS).get(response_stat_key, 0),
+                }
+                for rank, team in enumerate(teams_data, start=1)
+            ]
             return (stat, teams)
-        except Exception:
+        except Exception as e:
+            # Transient 429/5xx were already retried with backoff by the session
+            print(f"Warning: Could not fetch team rankings for {stat}: {e}")
             return (stat, [])
 
     def _fetch_player_stat(self, stat: str, season_year: str) -> tuple:
@@ -138,19 +165,19 @@ class RankingsChecker:
             players_data = response.get("players", [])
             stat_key = self.PLAYER_STAT_RESPONSE_KEYS.get(stat, stat.lower())
 
-            players = []
-            for player in players_data[:10]:
-                players.append(
-                    {
-                        "playerId": str(player.get("personId", "")),
-                        "playerName": player.get("name", ""),
-                        "teamTricode": player.get("teamAbbreviation", ""),
-                        "rank": player.get("rank", 0),
-                        "value": player.get(stat_key, 0),
-                    }
-                )
+            players = [
+                {
+                    "playerId": str(player.get("personId", "")),
+                    "playerName": player.get("name", ""),
+                    "teamTricode": player.get("teamAbbreviation", ""),
+                    "rank": player.get("rank", 0),
+                    "value": player.get(stat_key, 0),
+                }
+                for player in players_data[:10]
+            ]
             return (stat, players)
-        except Exception:
+        except Exception as e:
+            print(f"Warning: Could not fetch player rankings for {stat}: {e}")
             return (stat, [])
 
     def get_all_top_teams(self, season_year: str = "2025-26") -> Dict[str, List[dict]]:
@@ -162,8 +189,8 @@ class RankingsChecker:
         """
         rankings = {}
 
-        # Use ThreadPoolExecutor for parallel API calls
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # One worker per stat so every request is in flight at once
+        with ThreadPoolExecutor(max_workers=len(self.team_stats)) as executor:
             futures = {
                 executor.submit(self._fetch_team_stat, stat, season_year): stat
                 for stat in self.team_stats
@@ -188,8 +215,8 @@ class RankingsChecker:
         """
         rankings = {}
 
-        # Use ThreadPoolExecutor for parallel API calls
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        # One worker per stat so every request is in flight at once
+        with ThreadPoolExecutor(max_workers=len(self.player_stats)) as executor:
             futures = {
                 executor.submit(self._fetch_player_stat, stat, season_year): stat
                 for stat in self.player_stats
@@ -207,34 +234,65 @@ class RankingsChecker:
         """Build O(1) lookup index: team_id -> {stat: rank_info}"""
         self._team_rankings_index = {}
         for stat, teams in team_rankings.items():
+            stat_name = self.TEAM_STAT_NAMES.get(stat, stat)
             for team in teams:
-                team_id = str(team["teamId"])
-                if team_id not in self._team_rankings_index:
-                    self._team_rankings_index[team_id] = {}
-                self._team_rankings_index[team_id][stat] = {
-                    "stat": self.TEAM_STAT_NAMES.get(stat, stat),
+                # teamId is already a str from _fetch_team_stat
+                team_stats = self._team_rankings_index.setdefault(team["teamId"], {})
+                team_stats[stat] = {
+                    "stat": stat_name,
                     "rank": team["rank"],
                     "value": team["value"],
+                    # Display text, rendered once here rather than per message
+                    "text": f"#{team['rank']} in {stat_name} ({team['value']:.1f})",
                 }
 
+        # Order each team's stats by rank once, so lookups don't re-sort
+        for team_id, team_stats in self._team_rankings_index.items():
+            self._team_rankings_index[team_id] = dict(
+                sorted(team_stats.items(), key=lambda item: item[1]["rank"])
+            )
+
     def _build_player_rankings_by_team(self, player_rankings: Dict[str, List[dict]]):
         """Build O(1) lookup index: team_tricode -> [player_rank_info, ...]"""
         self._player_rankings_by_team = {}
         for stat, players in player_rankings.items():
+            stat_name = self.PLAYER_STAT_NAMES.get(stat, stat)
+            multiplier, value_format = _PLAYER_STAT_FORMATS.get(
+                stat_name, _PLAYER_STAT_FORMAT_DEFAULT
+            )
             for player in players:
                 if player["rank"] <= 10:
                     tricode = player["teamTricode"]
-                    if tricode not in self._player_rankings_by_team:
-                        self._player_rankings_by_team[tricode] = []
-                    self._player_rankings_by_team[tricode].append(
+                    value_text = value_format.format(player["value"] * multiplier)
+                    self._player_rankings_by_team.setdefault(tricode, []).append(
                         {
                             "playerName": player["playerName"],
-                            "stat": self.PLAYER_STAT_NAMES.get(stat, stat),
+                            "stat": stat_name,
                             "rank": player["rank"],
                             "value": player["value"],
+                            "text": f"#{player['rank']} in {stat_name} ({value_text})",
                         }
                     )
 
+        # Order each team's players by (rank, name) once, so lookups don't re-sort
+        for player_ranks in self._player_rankings_by_team.values():
+            player_ranks.sort(key=_BY_RANK_NAME)
+
+    def index_rankings(
+        self,
+        team_rankings: Dict[str, List[dict]],
+        player_rankings: Dict[str, List[dict]],
+    ):
+        """
+        Rebuild the lookup indexes for rankings that were not fetched here.
+
+        Args:
+            team_rankings: Team rankings (e.g., loaded from a cache)
+            player_rankings: Player rankings (e.g., loaded from a cache)
+        """
+        self._build_team_rankings_index(team_rankings)
+        self._build_player_rankings_by_team(player_rankings)
+
     def get_team_rankings(
         self, team_id: str, team_rankings: Dict[str, List[dict]]
     ) -> List[dict]:
@@ -242,28 +300,14 @@ class RankingsChecker:
         Get all rankings for a specific team using O(1) index lookup.
 
         Returns:
-            List of dicts with stat, rank, and value
+            List of dicts with stat, rank, value, and text (sorted by rank)
         """
-        # Use index if available (O(1) lookup)
-        if self._team_rankings_index is not None:
-            team_data = self._team_rankings_index.get(str(team_id), {})
-            team_ranks = list(team_data.values())
-            return sorted(team_ranks, key=lambda x: x["rank"])
-
-        # Fallback to iteration if index not built
-        team_ranks = []
-        for stat, teams in team_rankings.items():
-            for team in teams:
-                if str(team["teamId"]) == str(team_id):
-                    team_ranks.append(
-                        {
-                            "stat": self.TEAM_STAT_NAMES.get(stat, stat),
-                            "rank": team["rank"],
-                            "value": team["value"],
-                        }
-                    )
-                    break
-        return sorted(team_ranks, key=lambda x: x["rank"])
+        # Build the index on first use (e.g., rankings loaded from a cache)
+        if self._team_rankings_index is None:
+            self._build_team_rankings_index(team_rankings)
+
+        team_data = self._team_rankings_index.get(str(team_id), {})
+        return list(team_data.values())
 
     def get_player_rankings_for_team(
         self, team_tricode: str, player_rankings: Dict[str, List[dict]]
@@ -272,24 +316,11 @@ class RankingsChecker:
         Get all top-10 players from a specific team using O(1) index lookup.
 
         Returns:
-            List of dicts with player name, stat, rank, and value
+            List of dicts with player name, stat, rank, value, and text (sorted by rank)
         """
-        # Use index if available (O(1) lookup)
-        if self._player_rankings_by_team is not None:
-            player_ranks = self._player_rankings_by_team.get(team_tricode, [])
-            return sorted(player_ranks, key=lambda x: (x["rank"], x["playerName"]))
+        # Build the index on first use (e.g., rankings loaded from a cache)
+        if self._player_rankings_by_team is None:
+            self._build_player_rankings_by_team(player_rankings)
 
-        # Fallback to iteration if index not built
-        player_ranks = []
-        for stat, players in player_rankings.items():
-            for player in players:
-                if player["teamTricode"] == team_tricode and player["rank"] <= 10:
-                    player_ranks.append(
-                        {
-                            "playerName": player["playerName"],
-                            "stat": self.PLAYER_STAT_NAMES.get(stat, stat),
-                            "rank": player["rank"],
-                            "value": player["value"],
-                        }
-                    )
-        return sorted(player_ranks, key=lambda x: (x["rank"], x["playerName"]))
+        # Copy so callers can't reorder the shared index list
+        return list(self._player_rankings_by_team.get(team_tricode, []))
@@ -1,4 +1,8 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from .config import Config
 
@@ -21,8 +25,39 @@ class SlackClient:
         self.channel_id = channel_id or Config.SLACK_CHANNEL_ID_DAILY_THREADS
         self.headers = {
             "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
+            "Content-Type": "application/json; charset=utf-8",
         }
+        # Keep-alive session so consecutive posts reuse the TLS connection.
+        # Slack throttles bursts of concurrent replies with 429s, which are
+        # retried after Retry-After. Only 429, 503 (request not processed) and
+        # connection failures are retried: a post that reached Slack must not
+        # be sent twice.
+        retries = Retry(
+            total=5,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=retries),
+        )
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
     def send_message(self, text: str, thread_ts: str = None) -> dict:
         """
@@ -46,11 +81,16 @@ class SlackClient:
             payload["thread_ts"] = thread_ts
 
         try:
-            response = requests.post(
-                url, headers=self.headers, json=payload, timeout=10
-            )
+            # Content-Type: application/json is set on the session headers
+            response = self._session.post(url, data=orjson.dumps(payload), timeout=10)
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "unknown")
+                raise Exception(
+                    "Slack rate limit persisted after retries "
+                    f"(Retry-After: {retry_after}s)"
+                )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if not data.get("ok"):
                 error = data.get("error", "Unknown error")
@@ -58,7 +98,7 @@ class SlackClient:
 
             return data
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Failed to send Slack message: {e}")
 
     def send_game_with_thread(
@@ -77,6 +117,70 @@ class SlackClient:
         """
         # Send parent message
         parent_response = self.send_message(parent_text)
+        return self._send_thread_replies(parent_response, thread_text, injury_thread)
+
+    def send_games_with_threads(self, games: list, max_workers: int = 5):
+        """
+        Send multiple games, posting threaded replies for different games concurrently.
+
+        Parent messages are sent in order so games keep their sorted position in the
+        channel; only the replies, which depend on each parent's timestamp, overlap.
+
+        Args:
+            games: List of dicts with 'parent', 'thread', and 'injury_thread' texts
+            max_workers: Maximum number of games replying at once (default 5)
+
+        Yields:
+            Tuples of (index, result) as each game finishes, where result matches
+            the return value of send_game_with_thread()
+
+        Raises:
+            Exception: After all games finish, if any thread reply failed
+        """
+        # Failures name what was already posted, so a re-run can skip those games
+        parent_responses = []
+        for game in games:
+            try:
+                parent_responses.append(self.send_message(game["parent"]))
+            except Exception as e:
+                raise Exception(
+                    f"{e} ({len(parent_responses)}/{len(games)} parent messages sent)"
+                )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._send_thread_replies,
+                    parent_response,
+                    game.get("thread"),
+                    game.get("injury_thread"),
+                ): i
+                for i, (game, parent_response) in enumerate(
+                    zip(games, parent_responses)
+                )
+            }
+            # Let every game finish so all successes are reported before failing
+            failures = []
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failures.append((i, e))
+                    continue
+                yield i, result
+
+        if failures:
+            details = "; ".join(f"game {i + 1}: {e}" for i, e in sorted(failures))
+            raise Exception(
+                f"Thread replies failed for {len(failures)}/{len(games)} games "
+                f"(all {len(games)} parent messages sent): {details}"
+            )
+
+    def _send_thread_replies(
+        self, parent_response: dict, thread_text: str = None, injury_thread: str = None
+    ) -> dict:
+        """Send the stats and injury replies under an already-posted parent message."""
         parent_ts = parent_response.get("ts")
 
         result = {